@@ -1,11 +1,16 @@
 import streamlit as st
-import json
-import csv
+import orjson
 import io
+import json
+import math
 import re
 from datetime import datetime
-from typing import Dict, List, Any
-import pandas as pd
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Any, Tuple, TYPE_CHECKING
+
+# pandas and csv are imported where they're used so single-schema mode doesn't pay for them
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Page configuration
 st.set_page_config(
@@ -51,6 +56,26 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# JSON helpers (orjson leaves non-ASCII characters unescaped, like ensure_ascii=False)
+_DUMPS_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes"""
+    try:
+        return orjson.dumps(obj, option=_DUMPS_OPTIONS)
+    except orjson.JSONEncodeError:
+        # orjson rejects integers beyond 64 bits; the stdlib writes them exactly
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+def _dumps(obj: Any) -> str:
+    """Serialize to an indented JSON string"""
+    return _dumps_bytes(obj).decode()
+
+# orjson reads integers beyond 64 bits as floats and rejects out-of-range numbers such
+# as 1e400, so all user-supplied JSON (pasted documents, custom properties and object
+# fields from forms or CSV cells) is parsed with the stdlib instead
+_loads_exact = json.loads
+
 # Schema Type Definitions with their properties
 SCHEMA_DEFINITIONS = {
     "Article": {
@@ -115,31 +140,65 @@ PROPERTY_TYPES = {
     "object": ["author", "organizer", "location", "offers", "address", "contactPoint"]
 }
 
-def get_property_type(prop_name: str) -> str:
-    """Determine the appropriate input type for a property"""
-    for prop_type, props in PROPERTY_TYPES.items():
-        if prop_name in props:
-            return prop_type
-    return "text"
+# Freeze property groups so the precomputed lookups below can't drift
+for _schema_def in SCHEMA_DEFINITIONS.values():
+    for _group in ("required", "common", "advanced"):
+        _schema_def[_group] = tuple(_schema_def[_group])
+
+# Reverse index: property name -> input type (first listed type wins, e.g. sameAs -> url).
+# Classification is by exact name, so this stays a single hash lookup however large
+# PROPERTY_TYPES grows; a regex/pattern matcher would only be needed for partial matches.
+_PROP_TO_TYPE: Dict[str, str] = {}
+for _prop_type, _props in PROPERTY_TYPES.items():
+    for _prop in _props:
+        _PROP_TO_TYPE.setdefault(_prop, _prop_type)
+
+# Required properties per schema type as sets for fast membership checks
+_REQUIRED_SETS: Dict[str, frozenset] = {
+    schema_type: frozenset(schema_def["required"])
+    for schema_type, schema_def in SCHEMA_DEFINITIONS.items()
+}
+
+# JSON-LD header per schema type, copied rather than rebuilt for every generated schema
+_SCHEMA_TEMPLATE: Dict[str, Dict[str, str]] = {
+    schema_type: {"@context": "https://schema.org", "@type": schema_type}
+    for schema_type in SCHEMA_DEFINITIONS
+}
+
+# Per-schema-type (property, input type) pairs so render passes skip re-classification
+_SCHEMA_META: Dict[str, Dict[str, Any]] = {}
+for _schema_type, _schema_def in SCHEMA_DEFINITIONS.items():
+    _meta = {group: tuple((prop, _PROP_TO_TYPE.get(prop, "text")) for prop in _schema_def[group])
+             for group in ("required", "common", "advanced")}
+    _meta["types"] = dict(_meta["required"] + _meta["common"] + _meta["advanced"])
+    _SCHEMA_META[_schema_type] = _meta
+
+_WIDGET_EMOJI = {"url": "🔗", "date": "📅", "number": "🔢", "array": "📋", "object": "🏗️"}
+_WIDGET_LABEL_SUFFIX = {"array": " (one per line)", "object": " (JSON format)"}
+
+@lru_cache(maxsize=2048)
+def _widget_spec(prop_name: str, prop_type: str, key_suffix: str) -> Tuple[str, str]:
+    """Build the (label, key) pair for a property widget once per property/type/section"""
+    emoji = _WIDGET_EMOJI.get(prop_type, "📝")
+    label = f"{emoji} {prop_name}{_WIDGET_LABEL_SUFFIX.get(prop_type, '')}"
+    return label, f"{prop_name}_{key_suffix}"
 
 def create_dynamic_input(prop_name: str, prop_type: str, key_suffix: str = "") -> Any:
     """Create appropriate input widget based on property type"""
-    key = f"{prop_name}_{key_suffix}"
+    label, key = _widget_spec(prop_name, prop_type, key_suffix)
     
     if prop_type == "url":
-        return st.text_input(f"🔗 {prop_name}", placeholder="https://example.com", key=key)
+        return st.text_input(label, placeholder="https://example.com", key=key)
     elif prop_type == "date":
-        return st.date_input(f"📅 {prop_name}", key=key)
+        return st.date_input(label, key=key)
     elif prop_type == "number":
-        return st.number_input(f"🔢 {prop_name}", min_value=0, key=key)
+        return st.number_input(label, min_value=0, key=key)
     elif prop_type == "array":
-        return st.text_area(f"📋 {prop_name} (one per line)", 
-                           placeholder="Enter each item on a new line", key=key)
+        return st.text_area(label, placeholder="Enter each item on a new line", key=key)
     elif prop_type == "object":
-        return st.text_area(f"🏗️ {prop_name} (JSON format)", 
-                           placeholder='{"@type": "Person", "name": "John Doe"}', key=key)
+        return st.text_area(label, placeholder='{"@type": "Person", "name": "John Doe"}', key=key)
     else:
-        return st.text_input(f"📝 {prop_name}", key=key)
+        return st.text_input(label, key=key)
 
 def process_property_value(value: Any, prop_type: str) -> Any:
     """Process property value based on its type"""
@@ -152,10 +211,14 @@ def process_property_value(value: Any, prop_type: str) -> Any:
         return value
     elif prop_type == "object":
         if isinstance(value, str):
-            try:
-                return json.loads(value)
-            except:
-                return {"name": value}  # Fallback
+            # Only attempt a parse when the value looks like JSON; plain names skip the exception path
+            stripped = value.lstrip()
+            if stripped[:1] in ("{", "["):
+                try:
+                    return _loads_exact(stripped)
+                except json.JSONDecodeError:
+                    pass
+            return {"name": value}  # Fallback
         return value
     elif prop_type == "date":
         if hasattr(value, 'isoformat'):
@@ -166,10 +229,8 @@ def process_property_value(value: Any, prop_type: str) -> Any:
 
 def generate_schema(schema_type: str, properties: Dict[str, Any], id_value: str = None) -> Dict[str, Any]:
     """Generate a complete schema object"""
-    schema = {
-        "@context": "https://schema.org",
-        "@type": schema_type
-    }
+    template = _SCHEMA_TEMPLATE.get(schema_type)
+    schema = template.copy() if template else {"@context": "https://schema.org", "@type": schema_type}
     
     if id_value:
         schema["@id"] = id_value
@@ -177,8 +238,7 @@ def generate_schema(schema_type: str, properties: Dict[str, Any], id_value: str
     # Process properties
     for prop_name, prop_value in properties.items():
         if prop_value is not None:
-            prop_type = get_property_type(prop_name)
-            processed_value = process_property_value(prop_value, prop_type)
+            processed_value = process_property_value(prop_value, _PROP_TO_TYPE.get(prop_name, "text"))
             if processed_value is not None:
                 schema[prop_name] = processed_value
     
@@ -187,17 +247,20 @@ def generate_schema(schema_type: str, properties: Dict[str, Any], id_value: str
 def validate_schema(schema: Dict[str, Any], schema_type: str) -> List[str]:
     """Validate schema against requirements"""
     errors = []
-    required_props = SCHEMA_DEFINITIONS.get(schema_type, {}).get("required", [])
+    required_props = SCHEMA_DEFINITIONS.get(schema_type, {}).get("required", ())
+    missing = _REQUIRED_SETS.get(schema_type, frozenset()) - schema.keys()
     
+    # Iterate the ordered tuple so messages keep the definition order
     for required_prop in required_props:
-        if required_prop not in schema or not schema[required_prop]:
+        if required_prop in missing or not schema[required_prop]:
             errors.append(f"Missing required property: {required_prop}")
     
     return errors
 
-def process_bulk_data(data: List[Dict], schema_type: str) -> List[Dict]:
-    """Process bulk data into schema objects"""
+def process_bulk_data(data: List[Dict], schema_type: str) -> Tuple[List[Dict], List[Tuple[int, str]]]:
+    """Process bulk data into schema objects, returning (schemas, [(row, issues), ...])"""
     schemas = []
+    errors = []
     
     for i, row in enumerate(data):
         try:
@@ -205,13 +268,227 @@ def process_bulk_data(data: List[Dict], schema_type: str) -> List[Dict]:
             validation_errors = validate_schema(schema, schema_type)
             
             if validation_errors:
-                st.warning(f"Row {i+1} validation issues: {', '.join(validation_errors)}")
+                errors.append((i+1, ", ".join(validation_errors)))
             
             schemas.append(schema)
         except Exception as e:
-            st.error(f"Error processing row {i+1}: {str(e)}")
+            errors.append((i+1, f"Error processing row: {str(e)}"))
+    
+    return schemas, errors
+
+_FULL_DATE_RE = re.compile(r"(\d{4})([-/])(\d{1,2})\2(\d{1,2})", re.ASCII)
+_INVALID_DATE = object()
+
+def _normalize_date(value: Any) -> Any:
+    """Return YYYY-MM-DD for a complete year-first date, None to keep the value as typed,
+    or _INVALID_DATE when it looks like a full date but isn't one (e.g. 2024-02-30)"""
+    match = _FULL_DATE_RE.fullmatch(str(value))
+    if not match:
+        return None
+    try:
+        return datetime(int(match[1]), int(match[3]), int(match[4])).strftime("%Y-%m-%d")
+    except ValueError:
+        return _INVALID_DATE
+
+_INT_RE = re.compile(r"[+-]?\d+", re.ASCII)
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?", re.ASCII)
+
+def _parse_number(value: Any) -> Any:
+    """Convert plain numeric CSV text to int/float, keeping anything else (e.g. PT30M) as typed"""
+    text = str(value)
+    if _INT_RE.fullmatch(text):
+        return int(text)
+    if _FLOAT_RE.fullmatch(text):
+        number = float(text)
+        return number if math.isfinite(number) else value
+    return value
+
+def _bulk_generate_vectorized(df: "pd.DataFrame", schema_type: str) -> Tuple[List[Dict], List[Tuple[int, str]]]:
+    """Generate schema objects from a DataFrame, processing each property column at once.
+    
+    Returns the schemas and (row position, issue) pairs for cells that couldn't be converted.
+    """
+    import pandas as pd
+    
+    issues = []
+    df = df.astype(object).where(df.notna(), None)
+    cols_by_type = {t: [c for c in df.columns if _PROP_TO_TYPE.get(c, "text") == t] for t in PROPERTY_TYPES}
+    
+    # Built as an object Series so integers aren't widened to floats next to empty cells
+    for c in cols_by_type["number"]:
+        df[c] = pd.Series([None if v is None else _parse_number(v) for v in df[c].tolist()],
+                          index=df.index, dtype=object)
+    
+    # Only complete year-first dates (YYYY-MM-DD or YYYY/MM/DD) are normalized, each value
+    # on its own; partial dates, times, offsets and ambiguous formats are kept as typed
+    for c in cols_by_type["date"]:
+        values = df[c].tolist()
+        for pos, value in enumerate(values):
+            if value is None:
+                continue
+            normalized = _normalize_date(value)
+            if normalized is _INVALID_DATE:
+                issues.append((pos, f"{c} kept as typed (not a valid calendar date)"))
+            elif normalized is not None:
+                values[pos] = normalized
+        df[c] = pd.Series(values, index=df.index, dtype=object)
+    
+    for c in cols_by_type["array"]:
+        df[c] = df[c].fillna("").astype(str).str.split("\n").map(
+            lambda items: [item.strip() for item in items if item.strip()] or None)
+    
+    for c in cols_by_type["object"]:
+        df[c] = df[c].map(lambda value: process_property_value(value, "object"), na_action="ignore")
+    
+    # Add the JSON-LD header as columns so each record comes out complete; non-empty
+    # @context/@type cells in the CSV still win, as they do in generate_schema
+    df = df.astype(object).where(df.notna(), None)
+    base = _SCHEMA_TEMPLATE.get(schema_type) or {"@context": "https://schema.org", "@type": schema_type}
+    df = df.assign(**{k: df[k].where(df[k].notna(), v) if k in df.columns else v for k, v in base.items()})
+    
+    # Keep @id right after @context/@type, as generate_schema does
+    leading = [c for c in ("@context", "@type", "@id") if c in df.columns]
+    df = df[leading + [c for c in df.columns if c not in leading]]
+    
+    # Columns are object dtype already, so zip their lists rather than let to_dict box every cell
+    columns = list(df.columns)
+    schemas = [{k: v for k, v in zip(columns, row) if v} for row in zip(*(df[c].tolist() for c in columns))]
+    return schemas, issues
+
+# CSV uploads are always parsed in row chunks, so memory grows with the chunk rather
+# than the file and every upload goes through the same parsing rules
+_CSV_CHUNK_ROWS = 10_000
+
+# Every cell is read as typed; _bulk_generate_vectorized does all type conversion
+_CSV_READ_OPTIONS = {"dtype": object}
+
+def _iter_csv_schemas(file_bytes: bytes, schema_type: str) -> Iterator[Tuple[List[Dict], List[Tuple[int, str]]]]:
+    """Yield (schemas, [(row, issues), ...]) for each chunk of an uploaded CSV"""
+    import pandas as pd
+    
+    offset = 0
+    for chunk in pd.read_csv(io.BytesIO(file_bytes), chunksize=_CSV_CHUNK_ROWS, **_CSV_READ_OPTIONS):
+        schemas, conversion_issues = _bulk_generate_vectorized(chunk, schema_type)
+        issues_by_pos: Dict[int, List[str]] = {}
+        for pos, issue in conversion_issues:
+            issues_by_pos.setdefault(pos, []).append(issue)
+        
+        errors = []
+        for pos, schema in enumerate(schemas):
+            row_issues = issues_by_pos.get(pos, []) + validate_schema(schema, schema_type)
+            if row_issues:
+                errors.append((offset + pos + 1, ", ".join(row_issues)))
+        
+        yield schemas, errors
+        offset += len(schemas)
+
+def _csv_payloads(file_bytes: bytes, schema_type: str) -> Iterator[bytes]:
+    """Regenerate an uploaded CSV chunk by chunk, yielding each schema serialized"""
+    for schemas, _ in _iter_csv_schemas(file_bytes, schema_type):
+        for schema in schemas:
+            yield _dumps_bytes(schema)
+
+# Cached helpers so Streamlit reruns don't re-parse or regenerate unchanged input
+@st.cache_data(max_entries=4)
+def _preview_csv(file_bytes: bytes, rows: int = 5) -> "pd.DataFrame":
+    """Parse only the first rows of uploaded CSV bytes for display"""
+    import pandas as pd
+    return pd.read_csv(io.BytesIO(file_bytes), nrows=rows, **_CSV_READ_OPTIONS)
+
+@st.cache_data(max_entries=4)
+def _csv_summary(file_bytes: bytes, schema_type: str) -> Tuple[int, List[Tuple[int, str]]]:
+    """Count and validate the schemas for an uploaded CSV without keeping them"""
+    count = 0
+    errors = []
+    for schemas, chunk_errors in _iter_csv_schemas(file_bytes, schema_type):
+        count += len(schemas)
+        errors.extend(chunk_errors)
+    return count, errors
+
+@st.cache_data(max_entries=8)
+def _bulk_generate(data: List[Dict], schema_type: str) -> Tuple[List[Dict], List[Tuple[int, str]]]:
+    """Cached wrapper around process_bulk_data"""
+    return process_bulk_data(data, schema_type)
+
+@st.cache_data(max_entries=8)
+def _schema_payloads(schemas: List[Dict]) -> List[bytes]:
+    """Serialize each schema once; shared by every bulk output format"""
+    return [_dumps_bytes(schema) for schema in schemas]
+
+# Bulk output builders take any iterable of serialized schemas, so CSV uploads can
+# stream straight from their chunks
+def _json_array(payloads: Iterable[bytes]) -> str:
+    """Join serialized schemas into an indented JSON array, as _dumps(list) would"""
+    items = [b"  " + payload.replace(b"\n", b"\n  ") for payload in payloads]
+    return (b"[\n" + b",\n".join(items) + b"\n]").decode() if items else "[]"
+
+def _bulk_html(payloads: Iterable[bytes]) -> str:
+    """Render serialized schemas as consecutive <script type="application/ld+json"> blocks"""
+    parts = []
+    append = parts.append
+    for i, payload in enumerate(payloads):
+        append(f'<!-- Schema {i+1} -->\n<script type="application/ld+json">\n'.encode())
+        append(payload)
+        append(b'\n</script>\n\n')
+    return b"".join(parts).decode()
+
+# Example values for generated templates: per-property overrides win over per-type defaults
+_EXAMPLE_BY_PROP = {"name": "Example Name", "description": "Example description", "url": "https://example.com"}
+_EXAMPLE_BY_TYPE = {"date": "2024-01-01", "array": "item1|item2|item3", "url": "https://example.com"}
+_JSON_EXAMPLE_BY_PROP = {"name": "Example Name", "description": "Example description"}
+_JSON_EXAMPLE_BY_TYPE = {"array": ["example item 1", "example item 2"],
+                         "object": {"@type": "Thing", "name": "Example Object"}}
+
+def _template_props(schema_type: str, include_required: bool, include_common: bool,
+                    include_advanced: bool) -> List[Tuple[str, str]]:
+    """Collect (property, input type) pairs for a template, without duplicates"""
+    schema_meta = _SCHEMA_META[schema_type]
+    template_props = []
+    
+    if include_required:
+        template_props.extend(schema_meta["required"])
+    if include_common:
+        template_props.extend(schema_meta["common"])
+    if include_advanced:
+        template_props.extend(schema_meta["advanced"])
+    
+    # Remove duplicates while preserving order
+    return list(dict.fromkeys(template_props))
+
+@st.cache_data
+def _build_csv_template(schema_type: str, include_required: bool, include_common: bool,
+                        include_advanced: bool, include_examples: bool) -> str:
+    """Build a CSV template with a header row and an optional example row"""
+    import csv
+    
+    template_props = _template_props(schema_type, include_required, include_common, include_advanced)
+    rows = [["@id"] + [prop for prop, _ in template_props]]
+    
+    if include_examples:
+        rows.append(["https://example.com/#schema1"] + [
+            _EXAMPLE_BY_PROP.get(prop, _EXAMPLE_BY_TYPE.get(prop_type, "example value"))
+            for prop, prop_type in template_props
+        ])
     
-    return schemas
+    csv_buffer = io.StringIO()
+    csv.writer(csv_buffer).writerows(rows)
+    return csv_buffer.getvalue()
+
+@st.cache_data
+def _build_json_template(schema_type: str, include_required: bool, include_common: bool,
+                         include_advanced: bool, include_examples: bool) -> str:
+    """Build a JSON template containing a single example schema object"""
+    template_props = _template_props(schema_type, include_required, include_common, include_advanced)
+    template_obj = {"@context": "https://schema.org", "@type": schema_type}
+    
+    for prop, prop_type in template_props:
+        if include_examples:
+            template_obj[prop] = _JSON_EXAMPLE_BY_PROP.get(
+                prop, _JSON_EXAMPLE_BY_TYPE.get(prop_type, "example value"))
+        else:
+            template_obj[prop] = ""
+    
+    return _dumps([template_obj])
 
 # Main App
 def main():
@@ -231,6 +508,10 @@ def main():
     else:
         render_template_generator_mode()
 
+# A fragment reruns on its own when its widgets change, so typing into the form
+# regenerates only this view instead of re-executing the whole script. Inputs and
+# output stay in one fragment: split fragments would leave the preview stale.
+@st.fragment
 def render_single_schema_mode():
     """Render single schema generation interface"""
     
@@ -242,6 +523,7 @@ def render_single_schema_mode():
         # Schema type selection
         schema_type = st.selectbox("Select Schema Type", list(SCHEMA_DEFINITIONS.keys()))
         schema_def = SCHEMA_DEFINITIONS[schema_type]
+        schema_meta = _SCHEMA_META[schema_type]
         
         # ID field
         id_value = st.text_input("@id (optional)", placeholder="https://example.com/#schema")
@@ -254,8 +536,7 @@ def render_single_schema_mode():
         # Required properties
         if schema_def["required"]:
             st.markdown("### 🔴 Required Properties")
-            for prop in schema_def["required"]:
-                prop_type = get_property_type(prop)
+            for prop, prop_type in schema_meta["required"]:
                 value = create_dynamic_input(prop, prop_type, "required")
                 if value:
                     properties[prop] = value
@@ -266,8 +547,7 @@ def render_single_schema_mode():
             selected_common = st.multiselect("Select common properties to include", 
                                            schema_def["common"])
             for prop in selected_common:
-                prop_type = get_property_type(prop)
-                value = create_dynamic_input(prop, prop_type, "common")
+                value = create_dynamic_input(prop, schema_meta["types"][prop], "common")
                 if value:
                     properties[prop] = value
         
@@ -277,8 +557,7 @@ def render_single_schema_mode():
             selected_advanced = st.multiselect("Select advanced properties to include", 
                                              schema_def["advanced"])
             for prop in selected_advanced:
-                prop_type = get_property_type(prop)
-                value = create_dynamic_input(prop, prop_type, "advanced")
+                value = create_dynamic_input(prop, schema_meta["types"][prop], "advanced")
                 if value:
                     properties[prop] = value
         
@@ -288,9 +567,12 @@ def render_single_schema_mode():
                                    placeholder='{"customProp": "value", "anotherProp": ["item1", "item2"]}')
         if custom_props:
             try:
-                custom_data = json.loads(custom_props)
+                custom_data = _loads_exact(custom_props)
+            except json.JSONDecodeError:
+                custom_data = None
+            if isinstance(custom_data, dict):
                 properties.update(custom_data)
-            except:
+            else:
                 st.error("Invalid JSON format in custom properties")
     
     with col2:
@@ -309,7 +591,7 @@ def render_single_schema_mode():
             st.success("✅ Schema validation passed!")
         
         # Schema output
-        schema_json = json.dumps(schema, indent=2, ensure_ascii=False)
+        schema_json = _dumps(schema)
         
         # Tabs for different outputs
         tab1, tab2, tab3 = st.tabs(["JSON-LD", "HTML Script", "Microdata"])
@@ -346,13 +628,13 @@ def render_bulk_processing_mode():
                                ["Upload CSV", "Paste JSON", "Manual Entry"])
         
         bulk_data = []
+        csv_bytes = None
         
         if input_method == "Upload CSV":
             uploaded_file = st.file_uploader("Upload CSV file", type=['csv'])
             if uploaded_file:
-                df = pd.read_csv(uploaded_file)
-                st.dataframe(df.head())
-                bulk_data = df.to_dict('records')
+                csv_bytes = uploaded_file.getvalue()
+                st.dataframe(_preview_csv(csv_bytes))
                 
         elif input_method == "Paste JSON":
             json_input = st.text_area("Paste JSON array", 
@@ -360,20 +642,20 @@ def render_bulk_processing_mode():
                                      height=200)
             if json_input:
                 try:
-                    bulk_data = json.loads(json_input)
+                    bulk_data = _loads_exact(json_input)
                 except:
                     st.error("Invalid JSON format")
                     
         else:  # Manual Entry
             num_items = st.number_input("Number of items", min_value=1, max_value=50, value=3)
             bulk_data = []
+            schema_def = SCHEMA_DEFINITIONS[schema_type]
             
             for i in range(num_items):
                 st.markdown(f"#### Item {i+1}")
                 item_data = {}
                 
                 # Required fields for manual entry
-                schema_def = SCHEMA_DEFINITIONS[schema_type]
                 for prop in schema_def["required"]:
                     value = st.text_input(f"{prop}", key=f"manual_{prop}_{i}")
                     if value:
@@ -385,15 +667,25 @@ def render_bulk_processing_mode():
     with col2:
         st.markdown("### 📤 Bulk Output")
         
-        if bulk_data:
+        if csv_bytes is not None or bulk_data:
             # Process bulk data
-            schemas = process_bulk_data(bulk_data, schema_type)
+            if csv_bytes is not None:
+                schema_count, errors = _csv_summary(csv_bytes, schema_type)
+            else:
+                schemas, errors = _bulk_generate(bulk_data, schema_type)
+                schema_count = len(schemas)
+            
+            # One aggregated report instead of a Streamlit element per invalid row
+            if errors:
+                import pandas as pd
+                with st.expander(f"⚠️ {len(errors)} rows with validation issues", expanded=True):
+                    st.dataframe(pd.DataFrame(errors, columns=["row", "issues"]), use_container_width=True)
             
             # Stats
             st.markdown(f"""
             <div class="bulk-stats">
                 <h3>📈 Processing Stats</h3>
-                <p><strong>{len(schemas)}</strong> schemas generated</p>
+                <p><strong>{schema_count}</strong> schemas generated</p>
                 <p><strong>{schema_type}</strong> schema type</p>
             </div>
             """, unsafe_allow_html=True)
@@ -403,32 +695,36 @@ def render_bulk_processing_mode():
                                        ["Individual JSON files (ZIP)", "Combined JSON array", "HTML script tags"])
             
             if st.button("🚀 Generate Bulk Schemas"):
+                # CSV uploads are regenerated chunk by chunk into the output instead of
+                # keeping every schema in memory between reruns
+                if csv_bytes is not None:
+                    payloads = _csv_payloads(csv_bytes, schema_type)
+                else:
+                    payloads = _schema_payloads(schemas)
+                
                 if output_format == "Individual JSON files (ZIP)":
                     # Create ZIP file
                     import zipfile
                     zip_buffer = io.BytesIO()
                     
-                    with zipfile.ZipFile(zip_buffer, 'w') as zip_file:
-                        for i, schema in enumerate(schemas):
-                            schema_json = json.dumps(schema, indent=2, ensure_ascii=False)
+                    # JSON-LD compresses well, so deflate each member
+                    with zipfile.ZipFile(zip_buffer, 'w', compression=zipfile.ZIP_DEFLATED,
+                                         compresslevel=6) as zip_file:
+                        for i, payload in enumerate(payloads):
                             filename = f"schema_{i+1}_{schema_type.lower()}.json"
-                            zip_file.writestr(filename, schema_json)
+                            zip_file.writestr(filename, payload)
                     
                     st.download_button("📥 Download ZIP", zip_buffer.getvalue(), 
                                      f"bulk_schemas_{schema_type.lower()}.zip", "application/zip")
                 
                 elif output_format == "Combined JSON array":
-                    combined_json = json.dumps(schemas, indent=2, ensure_ascii=False)
+                    combined_json = _json_array(payloads)
                     st.code(combined_json, language="json")
                     st.download_button("📥 Download Combined JSON", combined_json, 
                                      f"bulk_schemas_{schema_type.lower()}.json", "application/json")
                 
                 else:  # HTML script tags
-                    html_output = ""
-                    for i, schema in enumerate(schemas):
-                        schema_json = json.dumps(schema, indent=2, ensure_ascii=False)
-                        html_output += f'<!-- Schema {i+1} -->\n<script type="application/ld+json">\n{schema_json}\n</script>\n\n'
-                    
+                    html_output = _bulk_html(payloads)
                     st.code(html_output, language="html")
                     st.download_button("📥 Download HTML", html_output, 
                                      f"bulk_schemas_{schema_type.lower()}.html", "text/html")
@@ -445,7 +741,6 @@ def render_template_generator_mode():
         st.markdown("### ⚙️ Template Configuration")
         
         schema_type = st.selectbox("Select Schema Type for Template", list(SCHEMA_DEFINITIONS.keys()))
-        schema_def = SCHEMA_DEFINITIONS[schema_type]
         
         include_required = st.checkbox("Include required properties", value=True)
         include_common = st.checkbox("Include common properties", value=True)
@@ -457,71 +752,16 @@ def render_template_generator_mode():
     with col2:
         st.markdown("### 📤 Generated Template")
         
-        # Build template structure
-        template_props = []
-        
-        if include_required:
-            template_props.extend(schema_def["required"])
-        if include_common:
-            template_props.extend(schema_def["common"])
-        if include_advanced:
-            template_props.extend(schema_def["advanced"])
-        
-        # Remove duplicates while preserving order
-        template_props = list(dict.fromkeys(template_props))
-        
         if template_format == "CSV":
-            # Create CSV template
-            csv_buffer = io.StringIO()
-            writer = csv.writer(csv_buffer)
-            
-            # Headers
-            headers = ["@id"] + template_props
-            writer.writerow(headers)
-            
-            # Example rows if requested
-            if include_examples:
-                example_row = ["https://example.com/#schema1"]
-                for prop in template_props:
-                    if prop == "name":
-                        example_row.append("Example Name")
-                    elif prop == "description":
-                        example_row.append("Example description")
-                    elif prop == "url":
-                        example_row.append("https://example.com")
-                    elif get_property_type(prop) == "date":
-                        example_row.append("2024-01-01")
-                    elif get_property_type(prop) == "array":
-                        example_row.append("item1|item2|item3")
-                    else:
-                        example_row.append("example value")
-                writer.writerow(example_row)
-            
-            csv_content = csv_buffer.getvalue()
+            csv_content = _build_csv_template(schema_type, include_required, include_common,
+                                              include_advanced, include_examples)
             st.text_area("CSV Template", csv_content, height=200)
             st.download_button("📥 Download CSV Template", csv_content, 
                              f"template_{schema_type.lower()}.csv", "text/csv")
         
         elif template_format == "JSON":
-            # Create JSON template
-            template_obj = {"@context": "https://schema.org", "@type": schema_type}
-            
-            for prop in template_props:
-                if include_examples:
-                    if prop == "name":
-                        template_obj[prop] = "Example Name"
-                    elif prop == "description":
-                        template_obj[prop] = "Example description"
-                    elif get_property_type(prop) == "array":
-                        template_obj[prop] = ["example item 1", "example item 2"]
-                    elif get_property_type(prop) == "object":
-                        template_obj[prop] = {"@type": "Thing", "name": "Example Object"}
-                    else:
-                        template_obj[prop] = "example value"
-                else:
-                    template_obj[prop] = ""
-            
-            json_template = json.dumps([template_obj], indent=2, ensure_ascii=False)
+            json_template = _build_json_template(schema_type, include_required, include_common,
+                                                 include_advanced, include_examples)
             st.code(json_template, language="json")
             st.download_button("📥 Download JSON Template", json_template, 
                              f"template_{schema_type.lower()}.json", "application/json")